@@ -1,5 +1,5 @@
 import requests
-from adapters.utils import canonicalize_url
+from adapters.utils import canonicalize_url, scrape_boards
 
 def org_from(rec):
     # if user supplied boards URL, try to infer org; else expect rec["org"]
@@ -10,15 +10,15 @@ def org_from(rec):
         return org
     return rec.get("org")
 
-def scrape(rec):
+def board_url(rec):
     org = org_from(rec)
-    if not org: 
-        return []
-    api = f"https://boards-api.greenhouse.io/v1/boards/{org}/jobs?content=true"
-    r = requests.get(api, timeout=20)
-    r.raise_for_status()
+    if not org:
+        return None
+    return f"https://boards-api.greenhouse.io/v1/boards/{org}/jobs?content=true"
+
+def parse_board(data):
     out = []
-    for j in r.json().get("jobs", []):
+    for j in data.get("jobs", []):
         loc = (j.get("location") or {}).get("name","")
         url = canonicalize_url(j.get("absolute_url",""))
         out.append({
@@ -31,3 +31,14 @@ def scrape(rec):
             "work_model": ""
         })
     return out
+
+def scrape(rec):
+    api = board_url(rec)
+    if not api: 
+        return []
+    r = requests.get(api, timeout=20)
+    r.raise_for_status()
+    return parse_board(r.json())
+
+def scrape_many(recs, clean=None):
+    return scrape_boards(recs, board_url, parse_board, "greenhouse", clean)
@@ -1,5 +1,5 @@
 import requests
-from adapters.utils import canonicalize_url
+from adapters.utils import canonicalize_url, scrape_boards
 
 def org_from(rec):
     url = rec["url"]
@@ -9,15 +9,15 @@ def org_from(rec):
         return org
     return rec.get("org")
 
-def scrape(rec):
+def board_url(rec):
     org = org_from(rec)
     if not org:
-        return []
-    api = f"https://api.lever.co/v0/postings/{org}?mode=json"
-    r = requests.get(api, timeout=20)
-    r.raise_for_status()
+        return None
+    return f"https://api.lever.co/v0/postings/{org}?mode=json"
+
+def parse_board(data):
     out = []
-    for j in r.json():
+    for j in data:
         locs = j.get("categories", {}).get("location", "") or ""
         url = canonicalize_url(j.get("hostedUrl",""))
         out.append({
@@ -31,3 +31,14 @@ def scrape(rec):
         })
     # Normalize posted_iso (ms → ISO) in filters layer; here we just pass through
     return out
+
+def scrape(rec):
+    api = board_url(rec)
+    if not api:
+        return []
+    r = requests.get(api, timeout=20)
+    r.raise_for_status()
+    return parse_board(r.json())
+
+def scrape_many(recs, clean=None):
+    return scrape_boards(recs, board_url, parse_board, "lever", clean)
@@ -1,12 +1,17 @@
-import requests, re, time, random
-from bs4 import BeautifulSoup
+import requests, re, time, random, json
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
 from urllib.parse import urlsplit, urlunsplit
+from urllib3.util import make_headers
 
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (compatible; JobScraperBot/1.0; +https://example.org/bot)",
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
 }
 
+# Concurrent board fetches (and pooled connections) for bulk ATS APIs
+BOARD_WORKERS = 16
+
 COLUMNS = [
     "Tier","Company","Role Category","Job Title","Location","Job ID/Req ID",
     "Direct Apply Link","Posted/Updated Timestamp (ISO)","Work Model","Notes"
@@ -17,6 +22,88 @@ def session():
     s.headers.update(HEADERS)
     return s
 
+def pooled_session(pool_size=BOARD_WORKERS):
+    """One session for many JSON API calls: keep-alive pool sized for the
+    worker count, and gzip/deflate (plus br when brotli is installed)"""
+    s = session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    s.mount("https://", adapter)
+    s.mount("http://", adapter)
+    s.headers.update(make_headers(accept_encoding=True))
+    s.headers["Accept"] = "application/json"
+    return s
+
+def fetch_json(s, url, timeout=20):
+    """GET a JSON document, streaming the body in chunks.
+    Returns (data, wire bytes, seconds)."""
+    started = time.perf_counter()
+    with s.get(url, timeout=timeout, stream=True) as r:
+        r.raise_for_status()
+        body = b"".join(r.raw.stream(64 * 1024, decode_content=True))
+        wire = r.raw.tell()
+    return json.loads(body), wire, time.perf_counter() - started
+
+def fetch_board(s, url, parse, clean=None, timeout=20):
+    """Fetch and parse one board inside the worker, so only the parsed jobs
+    (with descriptions already cleaned when clean is given) outlive the
+    call, not the raw JSON document. Returns (jobs, wire bytes, seconds)."""
+    data, wire, secs = fetch_json(s, url, timeout)
+    jobs = parse(data)
+    if clean:
+        for job in jobs:
+            job["description"] = clean(job.get("description", ""))
+    return jobs, wire, secs
+
+def fetch_boards(urls, parse, clean=None, workers=BOARD_WORKERS, timeout=20):
+    """Fetch and parse many JSON boards over one pooled session.
+    Yields (url, jobs or exception, wire bytes, seconds) as each finishes."""
+    s = pooled_session(workers)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(fetch_board, s, url, parse, clean, timeout): url for url in urls}
+        for fut in as_completed(futures):
+            url = futures.pop(fut)  # don't keep every result alive until the end
+            try:
+                jobs, wire, secs = fut.result()
+                yield url, jobs, wire, secs
+            except Exception as e:
+                yield url, e, 0, 0.0
+
+def scrape_boards(recs, board_url, parse, ats, clean=None, workers=BOARD_WORKERS):
+    """Batch-scrape board-style ATS records (Greenhouse, Lever).
+    Returns {company: jobs or exception}; boards shared by several
+    records are fetched once. A record whose board URL can't be built or
+    whose board fails to fetch or parse gets the exception, not an abort."""
+    results = {}
+    companies_by_url = {}
+    for rec in recs:
+        try:
+            url = board_url(rec)
+        except Exception as e:
+            print(f"[WARN] {ats} record {rec.get('company')} has no usable board: {e!r}")
+            results[rec.get("company")] = e
+            continue
+        if url:
+            companies_by_url.setdefault(url, []).append(rec["company"])
+        else:
+            results[rec["company"]] = []
+
+    started = time.perf_counter()
+    total_bytes = 0
+    for url, jobs, wire, secs in fetch_boards(list(companies_by_url), parse, clean, workers):
+        if isinstance(jobs, Exception):
+            print(f"[WARN] {ats} board {url} failed: {jobs!r}")
+        else:
+            total_bytes += wire
+            print(f"[INFO] {ats} board {url} — {len(jobs)} jobs, {wire / 1024:.1f} KB, {secs * 1000:.0f} ms")
+        for i, company in enumerate(companies_by_url[url]):
+            results[company] = jobs if i == 0 or isinstance(jobs, Exception) else [dict(j) for j in jobs]
+
+    elapsed = time.perf_counter() - started
+    if companies_by_url:
+        print(f"[INFO] {ats}: {len(companies_by_url)} boards, {total_bytes / 1024:.1f} KB "
+              f"in {elapsed:.1f}s ({len(companies_by_url) / max(elapsed, 1e-9) * 60:.0f} boards/min)")
+    return results
+
 def http_ok_and_has_apply(url, timeout=14):
     try:
         r = session().get(url, timeout=timeout, allow_redirects=True)
@@ -38,6 +125,7 @@ def canonicalize_url(url):
         return url
 
 def soup(url, timeout=20):
+    from bs4 import BeautifulSoup  # deferred: only the HTML adapters need it
     r = session().get(url, timeout=timeout)
     r.raise_for_status()
     return BeautifulSoup(r.text, "lxml")
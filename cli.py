@@ -0,0 +1,191 @@
+import time
+
+STARTED = time.perf_counter()
+
+import argparse
+import csv
+import json
+import os
+import sys
+from contextlib import contextmanager
+from importlib import import_module
+from tiers import TIERS
+
+# Everything heavier (scraper, adapters -> requests, discovery) is imported
+# inside the subcommand that needs it, so e.g. `stats` never loads requests.
+
+DATA_DIR = "data"
+
+# -----------------------------
+# TIMINGS
+# -----------------------------
+
+_timings = []
+
+@contextmanager
+def timed(label):
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        _timings.append((label, time.perf_counter() - started))
+
+def timed_import(name):
+    """import_module that records how long a not-yet-loaded module took"""
+    if name in sys.modules:
+        return sys.modules[name]
+    with timed(f"import {name}"):
+        return import_module(name)
+
+def report_timings(startup):
+    for label, secs in _timings:
+        print(f"[TIME] {label:<32} {secs * 1000:8.1f} ms", file=sys.stderr)
+    if startup is not None:
+        print(f"[TIME] {'startup (cli start -> first scrape)':<32} {startup * 1000:8.1f} ms", file=sys.stderr)
+    print(f"[TIME] {'total':<32} {(time.perf_counter() - STARTED) * 1000:8.1f} ms", file=sys.stderr)
+
+# -----------------------------
+# SUBCOMMANDS
+# -----------------------------
+
+def cmd_run_tier(args):
+    scraper = timed_import("scraper")
+    keys = list(TIERS) if args.tier == "all" else [args.tier]
+    index = None if args.dry_run else scraper.PostingIndex()
+    args.startup = time.perf_counter() - STARTED
+    with timed("run"):
+        scraper.run_tiers(keys, index, dry_run=args.dry_run)
+        if index is not None:
+            timed_import("feed").write_atom()
+            index.close()
+    return 0
+
+def cmd_run_company(args):
+    scraper = timed_import("scraper")
+    wanted = {name.lower() for name in args.names}
+
+    plan = []
+    with timed("load companies"):
+        for key, (tier_name, json_file, csv_file) in TIERS.items():
+            if args.tier and key != args.tier:
+                continue
+            recs = scraper.load_json(os.path.join(DATA_DIR, json_file))
+            hits = [rec for rec in recs if rec["company"].lower() in wanted]
+            if hits:
+                plan.append((tier_name, json_file, csv_file, hits))
+
+    found = {rec["company"].lower() for *_, hits in plan for rec in hits}
+    unknown = [name for name in args.names if name.lower() not in found]
+    for name in unknown:
+        print(f"[ERROR] Unknown company: {name}", file=sys.stderr)
+    if unknown:
+        return 1
+
+    for *_, hits in plan:
+        for rec in hits:
+            try:
+                timed_import(f"adapters.{rec['ats']}")
+            except ModuleNotFoundError:
+                pass  # run_for_tier reports the missing scraper
+
+    index = None if args.dry_run else scraper.PostingIndex()
+    feed = timed_import("feed")
+    head = feed.head()
+    args.startup = time.perf_counter() - STARTED
+    with timed("run"):
+        for tier_name, json_file, csv_file, hits in plan:
+            only = {rec["company"] for rec in hits}
+            scraper.run_for_tier(tier_name, json_file, csv_file, index, only=only, dry_run=args.dry_run)
+        if feed.head() != head:
+            feed.write_atom()  # rows were appended to the delta feed
+        if index is not None:
+            index.close()
+    return 0
+
+def cmd_discover(args):
+    discover = timed_import("discovery.discover")
+    for url in args.urls:
+        rec = discover.enrich_company_record({"company": url, "careers_url": url})
+        print(json.dumps(rec))
+    return 0
+
+def cmd_stats(args):
+    path = os.path.join(DATA_DIR, "stats.csv")
+    if not os.path.exists(path):
+        print("[INFO] No stats yet")
+        return 0
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        tier_name = TIERS[args.tier][0] if args.tier else None
+        rows = [r for r in csv.DictReader(f) if not tier_name or r["Tier"] == tier_name]
+    dates = sorted({r["Date"] for r in rows})[-args.days:]
+    print(f"{'Date':<12}{'Tier':<8}{'Scraped':>9}{'Accepted':>10}{'Added':>7}")
+    for r in rows:
+        if r["Date"] in dates:
+            print(f"{r['Date']:<12}{r['Tier']:<8}{r['Scraped']:>9}{r['Accepted']:>10}{r['Added']:>7}")
+    return 0
+
+def cmd_index(args):
+    return timed_import("index").main(args.rest)
+
+def cmd_feed(args):
+    return timed_import("feed").main(args.rest)
+
+# -----------------------------
+# ENTRY POINT
+# -----------------------------
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="cli.py", description="Job scraping feeds")
+    parser.add_argument("--timings", action="store_true",
+                        help="report import/phase timings (measured from when cli.py starts) on stderr")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+
+    run = sub.add_parser("run", help="scrape a tier or specific companies")
+    run_sub = run.add_subparsers(dest="target", required=True)
+
+    tier = run_sub.add_parser("tier", help="run a whole tier")
+    tier.add_argument("tier", choices=[*TIERS, "all"])
+    tier.add_argument("--dry-run", action="store_true", help="print accepted postings, write nothing")
+    tier.set_defaults(func=cmd_run_tier)
+
+    company = run_sub.add_parser("company", help="run one or more companies by name")
+    company.add_argument("names", nargs="+")
+    company.add_argument("--tier", choices=list(TIERS), help="only look in this tier")
+    company.add_argument("--dry-run", action="store_true", help="print accepted postings, write nothing")
+    company.set_defaults(func=cmd_run_company)
+
+    disc = sub.add_parser("discover", help="detect the ATS behind careers page URLs")
+    disc.add_argument("urls", nargs="+")
+    disc.set_defaults(func=cmd_discover)
+
+    stats = sub.add_parser("stats", help="show recent daily stats")
+    stats.add_argument("--tier", choices=list(TIERS), help="only this tier")
+    stats.add_argument("--days", type=int, default=7)
+    stats.set_defaults(func=cmd_stats)
+
+    idx = sub.add_parser("index", help="query the posting index (see index.py)", add_help=False)
+    idx.add_argument("rest", nargs=argparse.REMAINDER)
+    idx.set_defaults(func=cmd_index)
+
+    fd = sub.add_parser("feed", help="read the delta feed (see feed.py)", add_help=False)
+    fd.add_argument("rest", nargs=argparse.REMAINDER)
+    fd.set_defaults(func=cmd_feed)
+    return parser
+
+def main(argv=None):
+    parser = build_parser()
+    # index/feed pass everything through (including their own --help)
+    args, extra = parser.parse_known_args(argv)
+    if hasattr(args, "rest"):
+        args.rest = extra + args.rest
+    elif extra:
+        parser.error(f"unrecognized arguments: {' '.join(extra)}")
+    args.startup = None
+    try:
+        return args.func(args) or 0
+    finally:
+        if args.timings:
+            report_timings(args.startup)
+
+if __name__ == "__main__":
+    sys.exit(main())
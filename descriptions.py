@@ -0,0 +1,101 @@
+import html
+import re
+from filters import rejecting_patterns
+
+# Upper bound on what gets carried into the filters per posting
+MAX_DESCRIPTION_CHARS = 4000
+
+# Blocks worth keeping: anything the filters in filters.py look at
+# (sponsorship, seniority, experience, role category) plus the usual
+# requirement/qualification headings.
+RELEVANT_RE = re.compile(
+    r"sponsor|visa|citizen|green\s*card|clearance|authoriz"
+    r"|years?|experience|qualif|requirement|degree|grad|bachelor|master"
+    r"|intern|co[- ]?op|entry|junior|senior|staff|principal|\bmts\b",
+    re.IGNORECASE,
+)
+
+# Blocks the filters reject on are always kept, whatever their position;
+# only the rest is capped. The set is every rejecting pattern of the loaded
+# filter profiles (blocklist, seniority, stated years) plus these broader
+# sponsorship/clearance words, so it can't drift from filters.py.
+PRIORITY_RE = re.compile(
+    r"sponsor|visa|citizen|green\s*card|clearance|authoriz",
+    re.IGNORECASE,
+)
+
+# Tags whose boundaries should become line breaks so blocks stay separable
+BLOCK_TAG_RE = re.compile(
+    r"</?(?:p|div|br|li|ul|ol|tr|table|section|h[1-6]|blockquote|pre|hr)\b[^>]*>",
+    re.IGNORECASE,
+)
+SKIP_RE = re.compile(r"<(script|style|noscript)\b.*?</\1\s*>", re.IGNORECASE | re.DOTALL)
+TAG_RE = re.compile(r"<[a-zA-Z/!][^>]*>")
+
+WS_RE = re.compile(r"[ \t\r\f\v\xa0]+")
+
+# Lines, and sentences within long lines
+BLOCK_SPLIT_RE = re.compile(r"\n|(?<=[.!?])\s+(?=[A-Z])")
+
+def strip_html(text: str) -> str:
+    """Unescape (Greenhouse double-escapes its markup), drop tags, collapse whitespace"""
+    if not text:
+        return ""
+    if "&lt;" in text:
+        text = html.unescape(text)
+    if TAG_RE.search(text):
+        text = SKIP_RE.sub("", text)
+        text = BLOCK_TAG_RE.sub("\n", text)
+        text = TAG_RE.sub("", text)
+    text = html.unescape(text)
+    lines = (WS_RE.sub(" ", line).strip() for line in text.split("\n"))
+    return "\n".join(line for line in lines if line)
+
+def clean_description(text: str, max_chars: int = MAX_DESCRIPTION_CHARS) -> str:
+    """
+    Normalize a raw description once per posting: strip markup, then keep
+    only the blocks the filters care about. Blocks any rejecting filter
+    pattern (or PRIORITY_RE) matches are always kept; the other relevant blocks fill up to max_chars in order.
+    """
+    text = strip_html(text)
+    if not text:
+        return ""
+    blocks = [block for block in BLOCK_SPLIT_RE.split(text) if RELEVANT_RE.search(block)]
+    rejecting = [PRIORITY_RE, *rejecting_patterns()]
+    priority = [any(pat.search(block) for pat in rejecting) for block in blocks]
+    budget = max_chars - sum(len(b) + 1 for b, p in zip(blocks, priority) if p)
+
+    kept = []
+    for block, is_priority in zip(blocks, priority):
+        if is_priority:
+            kept.append(block)
+        elif len(block) + 1 <= budget:
+            kept.append(block)
+            budget -= len(block) + 1
+    return "\n".join(kept)
+
+if __name__ == "__main__":
+    # Cleaning must never change a filter verdict: python descriptions.py
+    import sys
+    from datetime import datetime, timezone
+    from filters import match_profiles
+
+    filler_li = "".join(f"<li>Experience with tool {i} and related qualifications</li>" for i in range(80))
+    filler_sentences = " ".join(f"Experience with tool {i}." for i in range(400))
+    cases = {
+        "years after long bullet list": f"<ul>{filler_li}</ul><p>Requires 5+ years of industry experience.</p>",
+        "years after long paragraph": f"<p>{filler_sentences} Minimum 7 years building services.</p>",
+        "sponsorship at the end": f"<ul>{filler_li}</ul><p>We cannot sponsor visas for this role.</p>",
+        "seniority at the end": f"<p>{filler_sentences} You will mentor as a senior member.</p>",
+        "plain comparisons": "<p>Latency < 10ms and throughput > 1k rps; 0-1 years experience.</p>",
+    }
+    now = datetime.now(timezone.utc).isoformat()
+    failed = 0
+    for name, raw in cases.items():
+        job = {"title": "Software Engineer, New Grad", "location": "Seattle, WA", "posted_iso": now}
+        before = match_profiles(dict(job, description=strip_html(raw)))
+        after = match_profiles(dict(job, description=clean_description(raw)))
+        ok = before == after
+        failed += not ok
+        print(f"{'ok' if ok else 'FAIL':<5} {name}: raw={before} cleaned={after}")
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,154 @@
+import argparse
+import json
+import os
+from datetime import datetime, timezone
+
+DATA_DIR = "data"
+FEED_DIR = os.path.join(DATA_DIR, "feed")
+ATOM_ENTRIES = 100
+
+# Entries per segment file. Segments are aligned (delta-000000000001,
+# delta-000000001001, ...), so the file holding any seq is computed, not
+# listed, and a run appends into the current segment instead of adding one.
+SEGMENT_ENTRIES = 1000
+
+# -----------------------------
+# HELPERS
+# -----------------------------
+
+def _atomic_write(path, text):
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+def _segment_path(feed_dir, seq):
+    """Path of the segment holding seq"""
+    first = (seq - 1) // SEGMENT_ENTRIES * SEGMENT_ENTRIES + 1
+    return os.path.join(feed_dir, f"delta-{first:012d}.jsonl")
+
+def _read_segment(path, last):
+    """Lines of a segment up to seq last (anything after is a torn append)"""
+    if not os.path.exists(path):
+        return []
+    with open(path, "r", encoding="utf-8") as f:
+        return [line for line in f if json.loads(line)["seq"] <= last]
+
+def head(feed_dir=FEED_DIR) -> int:
+    """Sequence number of the newest entry (0 when the feed is empty)"""
+    path = os.path.join(feed_dir, "HEAD")
+    if not os.path.exists(path):
+        return 0
+    with open(path, "r", encoding="utf-8") as f:
+        return int(f.read().strip() or 0)
+
+# -----------------------------
+# WRITE / READ
+# -----------------------------
+
+def append(rows, feed_dir=FEED_DIR) -> int:
+    """
+    Publish rows, numbering them after the current HEAD. They go into the
+    current segment until it holds SEGMENT_ENTRIES, then into the next.
+    Returns the new HEAD.
+    """
+    last = head(feed_dir)
+    if not rows:
+        return last
+
+    os.makedirs(feed_dir, exist_ok=True)
+    added = datetime.now(timezone.utc).isoformat()
+    segments = {}
+    for seq, row in enumerate(rows, start=last + 1):
+        path = _segment_path(feed_dir, seq)
+        if path not in segments:
+            segments[path] = _read_segment(path, last)
+        segments[path].append(json.dumps({"seq": seq, "added": added, "row": row}) + "\n")
+    # Segments first, HEAD second: a crash in between leaves entries past
+    # HEAD that readers ignore and the next append drops.
+    for path, lines in segments.items():
+        _atomic_write(path, "".join(lines))
+    _atomic_write(os.path.join(feed_dir, "HEAD"), str(last + len(rows)))
+    return last + len(rows)
+
+def read_after(cursor=0, limit=None, feed_dir=FEED_DIR):
+    """Yield entries with seq > cursor, oldest first, opening only the segments needed"""
+    last = head(feed_dir)
+    seq = cursor + 1
+    emitted = 0
+    while seq <= last:
+        path = _segment_path(feed_dir, seq)
+        if not os.path.exists(path):
+            return
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                entry = json.loads(line)
+                if entry["seq"] < seq:
+                    continue
+                if entry["seq"] > last or (limit and emitted >= limit):
+                    return
+                yield entry
+                emitted += 1
+        seq = (seq - 1) // SEGMENT_ENTRIES * SEGMENT_ENTRIES + SEGMENT_ENTRIES + 1
+
+def write_atom(path=None, limit=ATOM_ENTRIES, feed_dir=FEED_DIR):
+    """Render the newest entries as an Atom feed next to the segments"""
+    # Deferred: saxutils drags in urllib.request, which readers never need
+    from xml.sax.saxutils import escape, quoteattr
+
+    path = path or os.path.join(feed_dir, "atom.xml")
+    entries = list(read_after(max(head(feed_dir) - limit, 0), feed_dir=feed_dir))
+    updated = entries[-1]["added"] if entries else datetime.now(timezone.utc).isoformat()
+
+    parts = [
+        '<?xml version="1.0" encoding="utf-8"?>',
+        '<feed xmlns="http://www.w3.org/2005/Atom">',
+        "<title>New job postings</title>",
+        "<id>urn:job-scraping-feeds:delta</id>",
+        f"<updated>{escape(updated)}</updated>",
+    ]
+    for entry in reversed(entries):
+        row = entry["row"]
+        title = f"{row.get('Company', '')}: {row.get('Job Title', '')} ({row.get('Location', '')})"
+        link = row.get("Direct Apply Link", "")
+        parts += [
+            "<entry>",
+            f"<title>{escape(title)}</title>",
+            f"<id>urn:job-scraping-feeds:seq:{entry['seq']}</id>",
+            f"<link href={quoteattr(link)}/>",
+            f"<updated>{escape(entry['added'])}</updated>",
+            f"<summary>{escape(row.get('Tier', ''))} | {escape(row.get('Role Category', ''))}</summary>",
+            "</entry>",
+        ]
+    parts.append("</feed>")
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    _atomic_write(path, "\n".join(parts) + "\n")
+
+# -----------------------------
+# CLI
+# -----------------------------
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Read the delta feed of newly added postings")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+
+    r = sub.add_parser("read", help="print entries after a cursor as JSON lines")
+    r.add_argument("--after", type=int, default=0, help="last sequence number already seen")
+    r.add_argument("--limit", type=int)
+
+    sub.add_parser("head", help="print the newest sequence number")
+    sub.add_parser("atom", help="regenerate data/feed/atom.xml")
+
+    args = parser.parse_args(argv)
+    if args.cmd == "read":
+        for entry in read_after(args.after, args.limit):
+            print(json.dumps(entry))
+    elif args.cmd == "head":
+        print(head())
+    elif args.cmd == "atom":
+        write_atom()
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,8 @@
+import json
+import os
 import re
 from datetime import datetime, timedelta, timezone
+from locations import is_us
 
 # -----------------------------
 # CONFIG
@@ -27,6 +30,9 @@ SENIORITY_EXCLUDE = [
     r"\bmts\b",
 ]
 
+# Stated experience ("3 years", "5+ years"); the smallest number counts
+YEARS_RE = re.compile(r"(\d+)\s*\+?\s*years?", re.IGNORECASE)
+
 # Regex for role categories
 ROLE_KEYWORDS = {
     "Intern": [r"\bintern(ship)?\b"],
@@ -36,107 +42,164 @@ ROLE_KEYWORDS = {
     "Co-op": [r"\bco[- ]?op\b"],
 }
 
+# Rule profiles; every field of a profile falls back to the constants above
+PROFILES_PATH = os.path.join("data", "filter_profiles.json")
+
 # -----------------------------
 # HELPERS
 # -----------------------------
 
-def is_recent(posted_iso: str) -> bool:
-    """Check if job was posted in the last 24 hours"""
+def posting_age(posted_iso: str):
+    """Time since the posting went up, or None when the timestamp is missing/unparseable"""
     if not posted_iso:
-        return False
+        return None
     try:
         dt = datetime.fromisoformat(posted_iso.replace("Z", "+00:00"))
-        return dt >= datetime.now(timezone.utc) - timedelta(hours=POSTING_WINDOW_HOURS)
+        return datetime.now(timezone.utc) - dt
     except Exception:
-        return False
+        return None
 
 def is_us_location(loc: str) -> bool:
     """Keep only US-based roles (onsite, hybrid, or remote-US)"""
-    if not loc:
-        return False
-    loc_lower = loc.lower()
-    return any([
-        "united states" in loc_lower,
-        "us" in loc_lower,
-        "usa" in loc_lower,
-        re.search(r"\b[A-Z]{2}\b", loc),  # state abbreviations like NY, CA
-        "remote" in loc_lower and "north america" in loc_lower
-    ])
-
-def passes_visa_filter(text: str) -> bool:
-    """Reject if text explicitly blocks sponsorship"""
-    if not text:
-        return True
-    for pat in BLOCKLIST_PATTERNS:
-        if re.search(pat, text, re.IGNORECASE):
-            return False
-    return True
-
-def passes_seniority_filter(text: str) -> bool:
-    """Reject if title/desc mentions senior-level roles"""
-    if not text:
-        return True
-    for pat in SENIORITY_EXCLUDE:
-        if re.search(pat, text, re.IGNORECASE):
-            return False
-    return True
-
-def infer_role_category(title: str, description: str) -> str:
-    """Infer role category (Intern, New Grad, Entry-Level, Junior, Co-op)"""
-    text = f"{title} {description}".lower()
-    for cat, patterns in ROLE_KEYWORDS.items():
-        for pat in patterns:
-            if re.search(pat, text):
-                return cat
-    return "Entry-Level"  # default fallback
-
-def requires_low_experience(text: str) -> bool:
-    """Check if description requires ≤ 2 years experience"""
+    return is_us(loc)
+
+def min_experience_years(text: str):
+    """Smallest stated experience ("3 years", "5+ years"), or None if not specified"""
     if not text:
-        return True
-    # Find phrases like "3 years", "5+ years"
-    matches = re.findall(r"(\d+)\s*\+?\s*years?", text.lower())
-    if matches:
-        min_years = min(int(y) for y in matches)
-        return min_years <= MAX_EXPERIENCE_YEARS
-    return True  # assume OK if not specified
+        return None
+    years = [int(y) for y in YEARS_RE.findall(text)]
+    return min(years) if years else None
 
 # -----------------------------
-# MAIN FILTER PIPELINE
+# RULE PROFILES
 # -----------------------------
 
-def filter_job(job: dict) -> dict or None:
+def _plan_profiles(profiles: list) -> dict:
     """
-    Apply all filters to a single job dict.
-    Expected job keys:
-      id, title, location, apply_link, posted_iso, description, work_model
+    Turn profile dicts into a plan where every distinct regex is compiled
+    once and profiles refer to it by position, so a posting can be checked
+    against all profiles while running each pattern at most once. Bad
+    patterns fail here, at load time, not mid-run.
     """
-    title = job.get("title", "")
-    desc = job.get("description", "")
-    loc = job.get("location", "")
-    posted = job.get("posted_iso", "")
+    compiled = []
+    position = {}
+
+    def ref(pat):
+        if pat not in position:
+            position[pat] = len(compiled)
+            compiled.append(re.compile(pat, re.IGNORECASE))
+        return position[pat]
+
+    planned = []
+    for i, prof in enumerate(profiles):
+        roles = prof.get("role_keywords", ROLE_KEYWORDS)
+        planned.append({
+            "name": prof.get("name") or f"profile-{i + 1}",
+            "window_hours": prof.get("posting_window_hours", POSTING_WINDOW_HOURS),
+            "max_years": prof.get("max_experience_years", MAX_EXPERIENCE_YEARS),
+            "blocklist": [ref(p) for p in prof.get("blocklist_patterns", BLOCKLIST_PATTERNS)],
+            "seniority": [ref(p) for p in prof.get("seniority_exclude", SENIORITY_EXCLUDE)],
+            "roles": [[cat, [ref(p) for p in pats]] for cat, pats in roles.items()],
+            "title": [ref(p) for p in prof.get("title_keywords", [])],
+            "role_categories": prof.get("role_categories", []),
+        })
+    return {"compiled": compiled, "profiles": planned}
+
+def load_rules(path=PROFILES_PATH) -> dict:
+    """
+    Load the rule plan for a profile config (or the module constants when
+    there is no config file).
+    """
+    profiles = [{"name": "default"}]
+    if path and os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            profiles = json.load(f)["profiles"]
+    return _plan_profiles(profiles)
 
-    # 1. US only
-    if not is_us_location(loc):
-        return None
+_RULES = None
 
-    # 2. Freshness
-    if not is_recent(posted):
-        return None
+def get_rules() -> dict:
+    global _RULES
+    if _RULES is None:
+        _RULES = load_rules()
+    return _RULES
 
-    # 3. Visa filters
-    if not passes_visa_filter(f"{title} {desc}"):
-        return None
+def rejecting_patterns(rules: dict = None) -> list:
+    """
+    Every compiled regex that can reject a posting from its description in
+    any profile (blocklist, seniority, stated years), for
+    descriptions.clean_description to keep whatever it truncates.
+    """
+    rules = rules or get_rules()
+    idxs = sorted({i for prof in rules["profiles"] for i in prof["blocklist"] + prof["seniority"]})
+    return [rules["compiled"][i] for i in idxs] + [YEARS_RE]
 
-    # 4. Seniority exclusion
-    if not passes_seniority_filter(f"{title} {desc}"):
-        return None
+def match_profiles(job: dict, rules: dict = None) -> list:
+    """
+    Evaluate every profile against one posting in a single pass.
+    Returns [(profile name, role category), ...] for each matching profile.
+    """
+    rules = rules or get_rules()
+    title = job.get("title", "")
+    desc = job.get("description", "")
 
-    # 5. Experience
-    if not requires_low_experience(desc):
+    if not is_us_location(job.get("location", "")):
+        return []
+
+    age = posting_age(job.get("posted_iso", ""))
+    if age is None:
+        return []
+
+    targets = {"text": f"{title} {desc}", "title": title}
+    compiled = rules["compiled"]
+    memo = {}
+
+    def hit(idx, target):
+        key = (idx, target)
+        if key not in memo:
+            memo[key] = compiled[idx].search(targets[target]) is not None
+        return memo[key]
+
+    min_years = min_experience_years(desc)
+
+    matches = []
+    for prof in rules["profiles"]:
+        if age > timedelta(hours=prof["window_hours"]):
+            continue
+        if any(hit(i, "text") for i in prof["blocklist"]):
+            continue
+        if any(hit(i, "text") for i in prof["seniority"]):
+            continue
+        if min_years is not None and min_years > prof["max_years"]:
+            continue
+        if prof["title"] and not any(hit(i, "title") for i in prof["title"]):
+            continue
+        category = next(
+            (cat for cat, idxs in prof["roles"] if any(hit(i, "text") for i in idxs)),
+            "Entry-Level",  # default fallback
+        )
+        if prof["role_categories"] and category not in prof["role_categories"]:
+            continue
+        matches.append((prof["name"], category))
+    return matches
+
+# -----------------------------
+# MAIN FILTER PIPELINE
+# -----------------------------
+
+def filter_job(job: dict) -> dict or None:
+    """
+    Apply all filters to a single job dict.
+    Expected job keys:
+      id, title, location, apply_link, posted_iso, description, work_model
+    Adds role_category (from the first matching profile) and profiles
+    (names of every matching profile).
+    """
+    matches = match_profiles(job)
+    if not matches:
         return None
 
-    # 6. Enrich with inferred role category
-    job["role_category"] = infer_role_category(title, desc)
+    job["role_category"] = matches[0][1]
+    job["profiles"] = [name for name, _ in matches]
 
     return job
@@ -0,0 +1,278 @@
+import argparse
+import csv
+import glob
+import json
+import os
+import re
+import sqlite3
+from datetime import datetime, timezone
+
+DATA_DIR = "data"
+INDEX_PATH = os.path.join(DATA_DIR, "index", "postings.sqlite")
+
+# Row fields that get tokenized, keyed by the short name used in field queries.
+# The bit for each field is its position here; "desc" is the description text.
+INDEXED_FIELDS = {
+    "title": "Job Title",
+    "location": "Location",
+    "company": "Company",
+    "role": "Role Category",
+    "notes": "Notes",
+}
+FIELD_BITS = {field: 1 << i for i, field in enumerate([*INDEXED_FIELDS, "desc"])}
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS docs (
+    id      INTEGER PRIMARY KEY,
+    job_id  TEXT UNIQUE NOT NULL,
+    tier    TEXT,
+    role    TEXT,
+    posted  TEXT,
+    row     TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS docs_posted ON docs (posted);
+CREATE TABLE IF NOT EXISTS postings (
+    term    TEXT NOT NULL,
+    doc     INTEGER NOT NULL,
+    fields  INTEGER NOT NULL,
+    PRIMARY KEY (term, doc)
+) WITHOUT ROWID;
+"""
+
+# -----------------------------
+# HELPERS
+# -----------------------------
+
+def tokenize(text) -> list:
+    if not text:
+        return []
+    return TOKEN_RE.findall(str(text).lower())
+
+def doc_terms(row: dict, description: str = "") -> dict:
+    """term -> bitmask of the fields it appears in, for one posting"""
+    terms = {}
+    for field, column in INDEXED_FIELDS.items():
+        for tok in tokenize(row.get(column, "")):
+            terms[tok] = terms.get(tok, 0) | FIELD_BITS[field]
+    for tok in tokenize(description):
+        terms[tok] = terms.get(tok, 0) | FIELD_BITS["desc"]
+    return terms
+
+def parse_query(query: str) -> list:
+    """
+    Split a query into OR-groups of (negated, field, terms, is_prefix)
+    clauses; a clause matches docs having all of its terms, and is_prefix
+    applies to the last one.
+      data* seattle            -> data* AND seattle
+      intern OR "new grad"     -> intern OR (new AND grad)
+      analyst -"new grad"      -> analyst AND NOT (new AND grad)
+      title:data location:"new york" -> field-scoped terms
+    """
+    groups, clauses = [], []
+    for raw in re.findall(r'-?(?:\w+:)?"[^"]*"|\S+', query):
+        if raw == "OR":
+            if clauses:
+                groups.append(clauses)
+            clauses = []
+            continue
+        negated = raw.startswith("-")
+        raw = raw.lstrip("-")
+        field = None
+        if ":" in raw and not raw.startswith('"'):
+            field, raw = raw.split(":", 1)
+            field = field.lower()
+            if field not in FIELD_BITS:
+                raise ValueError(f"Unknown field {field!r} (use one of {', '.join(FIELD_BITS)})")
+        is_prefix = raw.endswith("*")
+        terms = tokenize(raw)
+        if terms:
+            clauses.append((negated, field, tuple(terms), is_prefix))
+    if clauses:
+        groups.append(clauses)
+    return groups
+
+def _term_sql(field, term, is_prefix):
+    """SELECT of the doc ids matching one term, using the (term, doc) key"""
+    if is_prefix:
+        # Terms are [a-z0-9]; \x7f sorts after all of them
+        sql, params = "SELECT doc FROM postings WHERE term >= ? AND term < ?", [term, term + "\x7f"]
+    else:
+        sql, params = "SELECT doc FROM postings WHERE term = ?", [term]
+    if field:
+        sql += " AND fields & ?"
+        params.append(FIELD_BITS[field])
+    return sql, params
+
+def _clause_sql(field, terms, is_prefix):
+    """SELECT of the doc ids having every term of one clause"""
+    selects = [_term_sql(field, term, is_prefix and i == len(terms) - 1) for i, term in enumerate(terms)]
+    sql = " INTERSECT ".join(sql for sql, _ in selects)
+    return sql, [p for _, params in selects for p in params]
+
+# -----------------------------
+# INDEX
+# -----------------------------
+
+class PostingIndex:
+    """
+    Incremental inverted index over accepted postings, stored in SQLite.
+    postings is keyed by (term, doc), so a query reads only the terms it
+    names (prefixes are a key range scan) and nothing is loaded up front.
+    The connection is opened lazily on first add/search.
+
+    data/index/ is not committed, so the hourly CI job starts from an empty
+    index each run. The index built incrementally by run_for_tier (which
+    includes cleaned description text) only persists on machines that keep
+    data/index/; elsewhere, `python index.py rebuild` backfills it from the
+    tier CSVs, without description text (desc: terms match nothing).
+    """
+
+    def __init__(self, path=INDEX_PATH):
+        self.path = path
+        self._db = None
+
+    def _conn(self):
+        if self._db is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self._db = sqlite3.connect(self.path)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.executescript(SCHEMA)
+        return self._db
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def add(self, rows, descriptions=None) -> int:
+        """Index rows not seen before; descriptions maps Job ID -> text"""
+        if not rows:
+            return 0
+        descriptions = descriptions or {}
+        indexed = datetime.now(timezone.utc).date().isoformat()
+        db = self._conn()
+        added = 0
+        with db:
+            for row in rows:
+                job_id = row.get("Job ID/Req ID", "")
+                if not job_id:
+                    continue
+                cur = db.execute(
+                    "INSERT OR IGNORE INTO docs (job_id, tier, role, posted, row) VALUES (?, ?, ?, ?, ?)",
+                    (job_id, row.get("Tier", ""), row.get("Role Category", ""),
+                     str(row.get("Posted/Updated Timestamp (ISO)", "")), json.dumps(dict(row, Indexed=indexed))),
+                )
+                if not cur.rowcount:
+                    continue  # already indexed
+                doc = cur.lastrowid
+                db.executemany(
+                    "INSERT INTO postings (term, doc, fields) VALUES (?, ?, ?)",
+                    [(term, doc, bits) for term, bits in doc_terms(row, descriptions.get(job_id, "")).items()],
+                )
+                added += 1
+        return added
+
+    def search(self, query="", tier=None, role_category=None, since=None, until=None, limit=None) -> list:
+        """
+        Boolean/prefix query plus filters. since/until compare against the
+        ISO posted timestamp (date prefixes like 2025-09-01 work).
+        Results are sorted newest first.
+        """
+        if not os.path.exists(self.path):
+            return []
+        groups = parse_query(query)
+        where, params = [], []
+
+        if groups:
+            selects = []
+            for clauses in groups:
+                positive = [_clause_sql(f, t, p) for neg, f, t, p in clauses if not neg]
+                negative = [_clause_sql(f, t, p) for neg, f, t, p in clauses if neg]
+                # Only negative clauses: start from every doc
+                positive = positive or [("SELECT id FROM docs", [])]
+                group = " INTERSECT ".join(sql for sql, _ in positive)
+                # A negated phrase drops docs having all of its terms, not any
+                group += "".join(f" EXCEPT SELECT * FROM ({sql})" for sql, _ in negative)
+                for _, p in positive + negative:
+                    params += p
+                selects.append(f"SELECT * FROM ({group})")
+            where.append(f"id IN ({' UNION '.join(selects)})")
+
+        if tier:
+            where.append("tier = ?")
+            params.append(tier)
+        if role_category:
+            where.append("role = ?")
+            params.append(role_category)
+        if since:
+            where.append("posted >= ?")
+            params.append(since)
+        if until:
+            # Inclusive on the given precision: "2025-09-07" keeps the whole day
+            where.append("substr(posted, 1, ?) <= ?")
+            params += [len(until), until]
+
+        sql = "SELECT row FROM docs"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY posted DESC"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        return [json.loads(row) for (row,) in self._conn().execute(sql, params)]
+
+def rebuild_from_csv(index, csv_paths) -> int:
+    """Backfill the index from existing tier CSVs (no description text)"""
+    added = 0
+    for path in csv_paths:
+        if not os.path.exists(path):
+            continue
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            added += index.add(list(csv.DictReader(f)))
+    return added
+
+# -----------------------------
+# CLI
+# -----------------------------
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Query the posting index")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+
+    q = sub.add_parser("search", help="boolean/prefix search over indexed postings")
+    q.add_argument("query", nargs="?", default="")
+    q.add_argument("--tier")
+    q.add_argument("--role", dest="role_category")
+    q.add_argument("--since", help="ISO date/timestamp, inclusive")
+    q.add_argument("--until", help="ISO date/timestamp, inclusive")
+    q.add_argument("--limit", type=int, default=50)
+    q.add_argument("--json", action="store_true", help="print one JSON row per line")
+
+    sub.add_parser("rebuild", help="backfill the index from data/tier*.csv (no description text)")
+
+    args = parser.parse_args(argv)
+    index = PostingIndex()
+
+    if args.cmd == "search":
+        try:
+            rows = index.search(args.query, args.tier, args.role_category, args.since, args.until, args.limit)
+        except ValueError as e:
+            print(f"[ERROR] {e}")
+            return 1
+        for row in rows:
+            if args.json:
+                print(json.dumps(row))
+            else:
+                print(f"{str(row.get('Posted/Updated Timestamp (ISO)', ''))[:10]} | {row.get('Company', '')} | "
+                      f"{row.get('Job Title', '')} | {row.get('Location', '')} | {row.get('Direct Apply Link', '')}")
+        print(f"[INFO] {len(rows)} result(s)")
+    elif args.cmd == "rebuild":
+        added = rebuild_from_csv(index, sorted(glob.glob(os.path.join(DATA_DIR, "tier*.csv"))))
+        print(f"[INFO] Indexed {added} posting(s)")
+    index.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+import json
+import os
+import re
+from datetime import datetime, timedelta, timezone
+
+DATA_DIR = "data"
+JOURNAL_DIR = os.path.join(DATA_DIR, "journal")
+
+# A journal older than this is from an abandoned run, not one to resume
+MAX_AGE_HOURS = 12
+
+class RunJournal:
+    """
+    Write-ahead log for one tier run. Every finished company is appended
+    (and fsynced) with its scraped count and accepted rows, so a restarted
+    run can skip it. A "commit" entry records the rows to append to the
+    tier CSV, written before the CSV itself; clear() removes the journal
+    once bookkeeping is done. A disabled journal (dry runs, company subsets) records nothing.
+    run_tiers keeps a separate "run" journal whose steps are the tiers
+    already finished.
+    """
+
+    def __init__(self, tier_name, path=None, enabled=True):
+        slug = re.sub(r"[^a-z0-9]+", "_", tier_name.lower()).strip("_")
+        self.path = path or os.path.join(JOURNAL_DIR, f"{slug}.jsonl")
+        self.completed = {}   # company -> {"scraped", "rows", "descriptions"}
+        self.committed = None # rows appended to the CSV, once committed
+        self.steps = set()    # post-commit steps already done (e.g. "feed")
+        self.feed_base = None # feed HEAD just before this run's rows were published
+        self.enabled = enabled
+        if enabled:
+            self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        entries = []
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entries.append(json.loads(line))
+                except ValueError:
+                    break  # torn write from a crash; everything before it is good
+
+        started = entries[0].get("started", "") if entries else ""
+        try:
+            fresh = datetime.fromisoformat(started) >= datetime.now(timezone.utc) - timedelta(hours=MAX_AGE_HOURS)
+        except ValueError:
+            fresh = False
+        if not fresh:
+            self.clear()
+            return
+
+        for entry in entries[1:]:
+            if entry["type"] == "company":
+                self.completed[entry["company"]] = entry
+            elif entry["type"] == "commit":
+                self.committed = entry["rows"]
+            elif entry["type"] == "feed_base":
+                self.feed_base = entry["head"]
+            elif entry["type"] == "step":
+                self.steps.add(entry["name"])
+        print(f"[INFO] Resuming from journal: {len(self.completed)} companies, {len(self.steps)} steps already done")
+
+    def _append(self, entry):
+        if not self.enabled:
+            return
+        new_file = not os.path.exists(self.path)
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            if new_file:
+                f.write(json.dumps({"type": "start", "started": datetime.now(timezone.utc).isoformat()}) + "\n")
+            f.write(json.dumps(entry) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def record_company(self, company, scraped, rows, descriptions):
+        entry = {
+            "type": "company",
+            "company": company,
+            "scraped": scraped,
+            "rows": rows,
+            "descriptions": descriptions,
+        }
+        self._append(entry)
+        self.completed[company] = entry
+
+    def record_commit(self, rows):
+        self._append({"type": "commit", "rows": rows})
+        self.committed = rows
+
+    def record_feed_base(self, head):
+        """Note the feed HEAD before publishing, so a resumed run can tell
+        whether its rows already went out"""
+        self._append({"type": "feed_base", "head": head})
+        self.feed_base = head
+
+    def record_step(self, name):
+        """Mark a non-idempotent post-commit step as done"""
+        self._append({"type": "step", "name": name})
+        self.steps.add(name)
+
+    def clear(self):
+        if self.enabled and os.path.exists(self.path):
+            os.remove(self.path)
+        self.completed = {}
+        self.committed = None
+        self.steps = set()
+        self.feed_base = None
@@ -1,9 +1,18 @@
 import json
 import os
 import csv
+import io
+import time
+from contextlib import contextmanager
 from datetime import datetime, timezone
+from functools import lru_cache
 from importlib import import_module
+from descriptions import clean_description
+import feed
 from filters import filter_job
+from index import PostingIndex
+from journal import RunJournal
+from tiers import TIERS
 
 DATA_DIR = "data"
 
@@ -12,53 +21,79 @@ DATA_DIR = "data"
 # -----------------------------
 
 def load_json(path):
+    return _load_json(path, os.path.getmtime(path))
+
+@lru_cache(maxsize=None)
+def _load_json(path, mtime):
+    # mtime is part of the key so an edited company list is re-read
     with open(path, "r", encoding="utf-8") as f:
         return json.load(f)
 
+@contextmanager
+def atomic_write(path):
+    """Write to a temp file next to path, then rename over it"""
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8", newline="") as f:
+        yield f
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+def read_text(path):
+    if not os.path.exists(path):
+        return ""
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        return f.read()
+
+def _csv_ids(text):
+    return {row["Job ID/Req ID"] for row in csv.DictReader(io.StringIO(text))}
+
+def new_csv_rows(path, rows):
+    """The rows whose Job ID is not in the CSV yet"""
+    seen_ids = _csv_ids(read_text(path))
+    return [r for r in rows if r["Job ID/Req ID"] not in seen_ids]
+
 def append_to_csv(path, rows, headers):
-    """Append only new rows by Job ID"""
-    seen_ids = set()
-    if os.path.exists(path):
-        with open(path, "r", encoding="utf-8", newline="") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                seen_ids.add(row["Job ID/Req ID"])
+    """Append only new rows by Job ID; returns the rows actually written.
+    Idempotent: appending the same rows again writes nothing."""
+    existing = read_text(path)
+    seen_ids = _csv_ids(existing)
 
     new_rows = [r for r in rows if r["Job ID/Req ID"] not in seen_ids]
 
     if not new_rows:
-        return 0
+        return []
 
-    write_header = not os.path.exists(path)
-    with open(path, "a", encoding="utf-8", newline="") as f:
+    with atomic_write(path) as f:
+        f.write(existing)
         writer = csv.DictWriter(f, fieldnames=headers)
-        if write_header:
+        if not existing:
             writer.writeheader()
         writer.writerows(new_rows)
 
-    return len(new_rows)
+    return new_rows
 
 def update_first_seen(path, companies):
-    seen = set()
-    if os.path.exists(path):
-        with open(path, "r", encoding="utf-8") as f:
-            seen = {line.strip().split(",")[0] for line in f if line.strip()}
+    existing = read_text(path)
+    seen = {line.strip().split(",")[0] for line in existing.splitlines() if line.strip()}
 
-    with open(path, "a", encoding="utf-8") as f:
+    with atomic_write(path) as f:
+        f.write(existing)
         for comp in companies:
             if comp not in seen:
                 f.write(f"{comp},{datetime.now(timezone.utc).date().isoformat()}\n")
 
 def update_run_history(path, tier, count):
-    with open(path, "a", encoding="utf-8") as f:
+    existing = read_text(path)
+    with atomic_write(path) as f:
+        f.write(existing)
         f.write(f"{datetime.now(timezone.utc).date().isoformat()},{tier},{count}\n")
 
 def update_stats(path, tier, scraped, accepted, added):
     """Write daily stats row for each tier, ensuring headers exist (date only)."""
-    from datetime import datetime
-    import pytz
+    from zoneinfo import ZoneInfo
 
-    LOCAL_TZ = pytz.timezone("America/Los_Angeles")
+    LOCAL_TZ = ZoneInfo("America/Los_Angeles")
     today = datetime.now(LOCAL_TZ).date().isoformat()
 
     rows = []
@@ -82,7 +117,7 @@ def update_stats(path, tier, scraped, accepted, added):
     })
 
     # Always rewrite the file with headers
-    with open(path, "w", encoding="utf-8", newline="") as f:
+    with atomic_write(path) as f:
         writer = csv.DictWriter(f, fieldnames=headers)
         writer.writeheader()
         writer.writerows(rows)
@@ -93,35 +128,92 @@ def get_scraper(ats):
     except ModuleNotFoundError:
         return None
 
+def prefetch_boards(companies, skip=()):
+    """
+    Fetch all records of ATSes whose adapter supports scrape_many in one
+    batch. Descriptions come back already cleaned, so the raw board HTML
+    is dropped as each board is parsed rather than held for the whole tier.
+    """
+    by_ats = {}
+    for rec in companies:
+        if rec["company"] not in skip:
+            by_ats.setdefault(rec["ats"], []).append(rec)
+
+    prefetched = {}
+    for ats, recs in by_ats.items():
+        scraper = get_scraper(ats)
+        if scraper and hasattr(scraper, "scrape_many"):
+            try:
+                prefetched.update(scraper.scrape_many(recs, clean=clean_description))
+            except Exception as e:
+                print(f"[WARN] Batch fetch for {ats} failed: {e!r}")
+                prefetched.update((rec["company"], e) for rec in recs)
+    return prefetched
+
 # -----------------------------
 # MAIN SCRAPER
 # -----------------------------
 
-def run_for_tier(tier_name, json_file, csv_file):
+def run_for_tier(tier_name, json_file, csv_file, index=None, only=None, dry_run=False):
+    """
+    Scrape, filter and record one tier. only limits the run to a set of
+    company names (case-insensitive); a subset run skips the journal and
+    the per-tier run_history/stats rows. dry_run writes nothing and just
+    prints what would be added. Returns the accepted rows.
+    """
     companies = load_json(os.path.join(DATA_DIR, json_file))
+    if only:
+        wanted = {name.lower() for name in only}
+        companies = [rec for rec in companies if rec["company"].lower() in wanted]
+    journal = RunJournal(tier_name, enabled=not (only or dry_run))
     all_jobs = []
+    descriptions = {}
     scraped_total = 0
+    filter_cpu = 0.0
+    prefetched = prefetch_boards(companies, skip=journal.completed)
 
     for rec in companies:
+        # Already finished by an earlier, interrupted run
+        done = journal.completed.get(rec["company"])
+        if done:
+            scraped_total += done["scraped"]
+            all_jobs.extend(done["rows"])
+            descriptions.update(done["descriptions"])
+            continue
+
         scraper = get_scraper(rec["ats"])
         if not scraper:
             print(f"[WARN] No scraper for {rec['company']} (ATS={rec['ats']})")
             continue
 
+        cleaned = rec["company"] in prefetched
         try:
-            jobs = scraper.scrape(rec)
+            if cleaned:
+                jobs = prefetched.pop(rec["company"])
+                if isinstance(jobs, Exception):
+                    raise jobs
+            else:
+                jobs = scraper.scrape(rec)
             scraped_total += len(jobs)
         except Exception as e:
             print(f"[ERROR] Failed {rec['company']}: {e}")
             continue
 
+        company_jobs = []
+        company_descriptions = {}
         for job in jobs:
             job["Tier"] = tier_name
             job["Company"] = rec["company"]
+            if not cleaned:
+                job["description"] = clean_description(job.get("description", ""))
 
+            started = time.process_time()
             filtered = filter_job(job)
+            filter_cpu += time.process_time() - started
             if filtered:
-                all_jobs.append({
+                # Only opt-in profiles are worth noting; "default" matches the old filter
+                extra = [name for name in filtered["profiles"] if name != "default"]
+                company_jobs.append({
                     "Tier": filtered["Tier"],
                     "Company": filtered["Company"],
                     "Role Category": filtered["role_category"],
@@ -131,8 +223,13 @@ def run_for_tier(tier_name, json_file, csv_file):
                     "Direct Apply Link": filtered.get("apply_link", ""),
                     "Posted/Updated Timestamp (ISO)": filtered.get("posted_iso", ""),
                     "Work Model": filtered.get("work_model", ""),
-                    "Notes": filtered.get("notes", ""),
+                    "Notes": filtered.get("notes") or ("Profiles: " + ", ".join(extra) if extra else ""),
                 })
+                company_descriptions[filtered.get("id", "")] = filtered.get("description", "")
+
+        journal.record_company(rec["company"], len(jobs), company_jobs, company_descriptions)
+        all_jobs.extend(company_jobs)
+        descriptions.update(company_descriptions)
 
     headers = [
         "Tier",
@@ -147,24 +244,75 @@ def run_for_tier(tier_name, json_file, csv_file):
         "Notes"
     ]
 
-    count = append_to_csv(os.path.join(DATA_DIR, csv_file), all_jobs, headers)
+    if dry_run:
+        for row in all_jobs:
+            print(f"[DRY RUN] {row['Company']} | {row['Job Title']} | {row['Location']} | {row['Direct Apply Link']}")
+        print(f"[INFO] {tier_name} (dry run) — Scraped: {scraped_total} | Accepted: {len(all_jobs)} | Filter CPU: {filter_cpu:.2f}s")
+        return all_jobs
+
+    # Journal the rows to add before touching the CSV, then (re)apply them:
+    # a run that died on either side of the CSV write resumes with the same
+    # rows, and append_to_csv skips whichever already made it to disk.
+    csv_path = os.path.join(DATA_DIR, csv_file)
+    if journal.committed is None:
+        journal.record_commit(new_csv_rows(csv_path, all_jobs))
+    new_rows = journal.committed
+    append_to_csv(csv_path, new_rows, headers)
+    count = len(new_rows)
+
+    # Publish exactly the appended rows to the delta feed, once. The HEAD
+    # is journaled before publishing: if it has already moved past that
+    # when a resumed run gets here, the rows went out before the crash.
+    if "feed" not in journal.steps:
+        if journal.feed_base is None:
+            journal.record_feed_base(feed.head())
+        if feed.head() == journal.feed_base:
+            feed.append(new_rows)
+        journal.record_step("feed")
+
+    # Index only what was actually appended
+    if index is not None:
+        index.add(new_rows, descriptions)
 
     # Stats breakdown
     scraped = scraped_total
     accepted = len(all_jobs)
     added = count
 
-    # Update logs
+    # Update logs (first_seen and stats are idempotent; run_history appends)
     update_first_seen(os.path.join(DATA_DIR, "first_seen.csv"), [rec["company"] for rec in companies])
-    update_run_history(os.path.join(DATA_DIR, "run_history.csv"), tier_name, count)
-    update_stats(os.path.join(DATA_DIR, "stats.csv"), tier_name, scraped, accepted, added)
-
-    print(f"[INFO] {tier_name} — Scraped: {scraped} | Accepted: {accepted} | Added: {added}")
-
+    if not only:
+        if "run_history" not in journal.steps:
+            update_run_history(os.path.join(DATA_DIR, "run_history.csv"), tier_name, count)
+            journal.record_step("run_history")
+        update_stats(os.path.join(DATA_DIR, "stats.csv"), tier_name, scraped, accepted, added)
+    journal.clear()
+
+    print(f"[INFO] {tier_name} — Scraped: {scraped} | Accepted: {accepted} | Added: {added} | Filter CPU: {filter_cpu:.2f}s")
+    return all_jobs
+
+
+def run_tiers(keys, index=None, dry_run=False):
+    """
+    Run several tiers in order. A run-level journal records each finished
+    tier, so a run that dies in Tier 2 resumes there instead of redoing
+    Tier 1.
+    """
+    run = RunJournal("run", enabled=not dry_run and len(keys) > 1)
+    for key in keys:
+        tier_name, json_file, csv_file = TIERS[key]
+        if tier_name in run.steps:
+            print(f"[INFO] {tier_name} already finished in this run, skipping")
+            continue
+        run_for_tier(tier_name, json_file, csv_file, index, dry_run=dry_run)
+        run.record_step(tier_name)
+    run.clear()
 
 def main():
-    run_for_tier("Tier 1", "tier1.json", "tier1.csv")
-    run_for_tier("Tier 2", "fortune500.json", "tier2.csv")
+    index = PostingIndex()
+    run_tiers(list(TIERS), index)
+    feed.write_atom()
+    index.close()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,6 @@
+# Tier key -> (tier name, company list, output CSV). Kept apart from
+# scraper.py so cli.py can map tier keys without importing the scraper.
+TIERS = {
+    "1": ("Tier 1", "tier1.json", "tier1.csv"),
+    "2": ("Tier 2", "fortune500.json", "tier2.csv"),
+}